@@ -0,0 +1,138 @@
+"""
+Fast date parsing shared by the request schemas.
+
+The API accepts ISO 8601 as well as a handful of local formats
+(DD/MM/YYYY, MM/DD/YYYY, DD.MM.YYYY, ...). The common fixed-width shapes
+are built straight from string slices; other input goes through
+datetime.fromisoformat and finally a single precompiled regex that pulls
+out the three numeric parts.
+
+Results are memoised per input string: clients re-submit the same few
+dates constantly (pagination, form retries, bulk imports), and date and
+datetime objects are immutable so sharing them is safe.
+"""
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
+
+_UTC = timezone.utc
+
+# Longest accepted input, e.g. 2025-01-31T10:00:00.123456+05:30 plus slack
+_MAX_DATE_LEN = 40
+
+# Three numeric parts separated by '-', '/', '.' or a space
+_DATE_RE = re.compile(r'^(\d{1,4})([-/. ])(\d{1,2})[-/. ](\d{1,4})$')
+
+
+def _from_parts(year: int, first: int, second: int, day_first: bool) -> datetime:
+    """Build a datetime from the two non-year parts, trying the other order if invalid."""
+    if day_first:
+        first, second = second, first
+    try:
+        return datetime(year, first, second)
+    except ValueError:
+        return datetime(year, second, first)
+
+
+def _parse_fixed_width(s: str, day_first: bool) -> datetime | None:
+    """Parse YYYY?MM?DD and DD?MM?YYYY / MM?DD?YYYY without strptime."""
+    if len(s) != 10:
+        return None
+    sep = s[4]
+    if sep in '-/.' and s[7] == sep:
+        if s[0:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit():
+            return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        return None
+    sep = s[2]
+    if sep in '-/.' and s[5] == sep:
+        if not (s[0:2].isdigit() and s[3:5].isdigit() and s[6:10].isdigit()):
+            return None
+        # Dotted dates are always read day-first
+        return _from_parts(int(s[6:10]), int(s[0:2]), int(s[3:5]), day_first or sep == '.')
+    return None
+
+
+def _parse_numeric(s: str, day_first: bool) -> datetime | None:
+    """Parse variable-width numeric dates such as 2025/1/5, 5.1.2025 or 1 5 2025."""
+    match = _DATE_RE.match(s)
+    if match is None:
+        return None
+    first, sep, second, last = match.groups()
+    if len(first) == 4:
+        return datetime(int(first), int(second), int(last))
+    if len(last) == 4:
+        return _from_parts(int(last), int(first), int(second), day_first or sep == '.')
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(s: str, day_first: bool = False) -> datetime:
+    """
+    Parse a date or datetime string into a datetime.
+
+    - Fixed-width numeric dates are built directly from slices.
+    - ISO 8601 strings (with time and/or offset) go through fromisoformat.
+    - Other numeric dates are matched by one regex and built from its groups.
+
+    Ambiguous DD/MM vs MM/DD input is read month-first unless day_first is
+    set; dotted dates are always day-first. Raises ValueError if nothing
+    matches.
+    """
+    s = s.strip()
+    # Every supported shape is short, ASCII and starts with a digit; reject
+    # anything else before trying the parsers below
+    if not s or len(s) > _MAX_DATE_LEN or not s[0].isdigit() or not s.isascii():
+        raise ValueError(f"Unrecognised date: {s!r}")
+    try:
+        parsed = _parse_fixed_width(s, day_first)
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        return parsed
+
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+
+    try:
+        parsed = _parse_numeric(s, day_first)
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        return parsed
+    raise ValueError(f"Unrecognised date: {s!r}")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(s: str, day_first: bool = False) -> date:
+    """Parse a date string (see parse_datetime) and return only the date part."""
+    return parse_datetime(s, day_first).date()
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime_utc(s: str) -> datetime:
+    """parse_datetime, with naive results made UTC-aware (cached, so the replace happens once per input)."""
+    dt = parse_datetime(s)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return dt
+
+
+def validate_flexible_datetime(v, field_name: str, assume_utc: bool = False):
+    """
+    Shared body for the leave and holiday date validators.
+
+    Strings are parsed with parse_datetime; datetimes and None pass through.
+    With assume_utc, naive results are made UTC-aware.
+    """
+    if isinstance(v, str):
+        try:
+            return parse_datetime_utc(v) if assume_utc else parse_datetime(v)
+        except ValueError:
+            raise ValueError(
+                f"Invalid {field_name} format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc."
+            )
+    if assume_utc and isinstance(v, datetime) and v.tzinfo is None:
+        v = v.replace(tzinfo=_UTC)
+    return v
@@ -56,16 +56,23 @@ success_logger.propagate = False
 
 def log_info(
     message: str,
+    *args,
     module: Optional[str] = None,
     user_id: Optional[int] = None,
     request_path: Optional[str] = None,
     request_method: Optional[str] = None,
     ip_address: Optional[str] = None
 ):
-    """Log success/info message to success.log file."""
+    """
+    Log success/info message to success.log file.
+    
+    Extra positional args are %-formatted into message only if INFO is enabled.
+    """
+    if not success_logger.isEnabledFor(logging.INFO):
+        return
     try:
         # Build log message with context
-        log_parts = [message]
+        log_parts = [message % args if args else message]
         
         if module:
             log_parts.append(f"[Module: {module}]")
@@ -85,6 +92,7 @@ def log_info(
 
 def log_error(
     message: str,
+    *args,
     module: Optional[str] = None,
     user_id: Optional[int] = None,
     error_details: Optional[str] = None,
@@ -93,10 +101,16 @@ def log_error(
     ip_address: Optional[str] = None,
     exc_info: Optional[Exception] = None
 ):
-    """Log error message to error.log file."""
+    """
+    Log error message to error.log file.
+    
+    Extra positional args are %-formatted into message only if ERROR is enabled.
+    """
+    if not error_logger.isEnabledFor(logging.ERROR):
+        return
     try:
         # Build log message with context
-        log_parts = [message]
+        log_parts = [message % args if args else message]
         
         if module:
             log_parts.append(f"[Module: {module}]")
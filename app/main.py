@@ -8,6 +8,7 @@ from app.database import engine
 from app.models import Base
 from app.routes import auth, users, leaves, holidays, admin, email, employees, tasks, tracker, logs, time_corrections
 from app.logger import log_info, log_error
+from app.timezone_utils import RequestClockMiddleware
 from app.exceptions import (
     http_exception_handler,
     validation_exception_handler,
@@ -15,6 +16,7 @@ from app.exceptions import (
 )
 from app.response import APIResponse
 from app.storage import STORAGE_TYPE
+from app.schema import prewarm_schemas
 from app.scheduler import start_scheduler, shutdown_scheduler, scheduler
 import os
 
@@ -27,6 +29,13 @@ async def lifespan(app: FastAPI):
     # Run: python run_alembic_migration.py upgrade head
     # to ensure database is up to date
     
+    # Build deferred pydantic schemas now instead of on the first request
+    try:
+        prewarm_schemas()
+        log_info("Response schemas pre-warmed")
+    except Exception as e:
+        log_error(f"Failed to pre-warm schemas: {str(e)}", exc_info=e)
+    
     # Start scheduler for automated tasks
     try:
         start_scheduler()
@@ -61,6 +70,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Share one IST clock reading per request (see get_now_and_today_ist)
+app.add_middleware(RequestClockMiddleware)
+
 # Register exception handlers for standardized error responses
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
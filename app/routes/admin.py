@@ -13,14 +13,16 @@ from app.database import get_db, monitor_query
 from app.models import User, Leave, Holiday, LeaveStatus, UserRole, DocumentStatus, EmploymentHistory, TimeTracker, TrackerStatus
 from app.schema import (
     UserResponse, LeaveResponse, HolidayResponse, TrackerResponse, UserCreate,
-    EmploymentHistoryResponse, EmployeeSummary, EnhancedTrackerResponse,
+    EmploymentHistoryResponse, EmployeeSummary, EmployeeSummaryListItem, EnhancedTrackerResponse,
     EmployeeDetailsCreate, EmployeeDetailsUpdate, EmploymentHistoryCreate, AdminUserUpdate,
-    TrackerHoursSummary, TrackerDailyHours, TrackerUserHours, DurationHMS, AdminPasswordReset
+    apply_employee_details_patch, LEAVE_RESPONSE_LIST, USER_RESPONSE_LIST, json_list_response,
+    TrackerHoursSummary, TrackerDailyHours, TrackerUserHours, hms_breakdown, AdminPasswordReset
 )
 from app.auth import get_current_admin_user, get_password_hash
+from app._date_fast import parse_datetime
 from app.logger import log_info, log_error
 from app.response import APIResponse
-from app.storage import storage
+from app.storage import StorageInterface, get_storage
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 IST = ZoneInfo("Asia/Kolkata")
@@ -39,6 +41,7 @@ async def safe_get_employee_details(db: AsyncSession, user_id: int):
 async def admin_upload_profile_image(
     user_id: int,
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -72,6 +75,7 @@ async def admin_upload_profile_image(
 async def admin_upload_aadhaar_front(
     user_id: int,
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -105,6 +109,7 @@ async def admin_upload_aadhaar_front(
 async def admin_upload_aadhaar_back(
     user_id: int,
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -138,6 +143,7 @@ async def admin_upload_aadhaar_back(
 async def admin_upload_pan(
     user_id: int,
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -252,38 +258,33 @@ async def get_dashboard_stats(
             pending_leaves = 0
             upcoming_holidays = 0
             
-            # Get total users (safe)
-            try:
-                total_users_result = await db.execute(select(func.count(User.id)))
-                total_users = total_users_result.scalar() or 0
-            except Exception as e:
-                log_error(f"Error getting total users: {str(e)}")
-            
             # Get active users today (tracking disabled)
             active_users = 0
             
-            # Get pending leaves (safe)
-            try:
-                pending_leaves_result = await db.execute(
-                    select(func.count(Leave.id)).where(Leave.status == LeaveStatus.PENDING)
-                )
-                pending_leaves = pending_leaves_result.scalar() or 0
-            except Exception as e:
-                log_error(f"Error getting pending leaves: {str(e)}")
-            
-            # Get upcoming holidays (safe)
+            # Total users, pending leaves and upcoming holidays in one round-trip (safe)
             try:
-                upcoming_holidays_result = await db.execute(
-                    select(func.count(Holiday.id)).where(
-                        and_(
-                            func.date(Holiday.date) >= today,
-                            Holiday.is_active == True
+                counts_result = await db.execute(
+                    select(
+                        select(func.count(User.id)).scalar_subquery(),
+                        select(func.count(Leave.id))
+                        .where(Leave.status == LeaveStatus.PENDING)
+                        .scalar_subquery(),
+                        select(func.count(Holiday.id))
+                        .where(
+                            and_(
+                                func.date(Holiday.date) >= today,
+                                Holiday.is_active == True
+                            )
                         )
+                        .scalar_subquery()
                     )
                 )
-                upcoming_holidays = upcoming_holidays_result.scalar() or 0
+                total_users, pending_leaves, upcoming_holidays = counts_result.one()
+                total_users = total_users or 0
+                pending_leaves = pending_leaves or 0
+                upcoming_holidays = upcoming_holidays or 0
             except Exception as e:
-                log_error(f"Error getting upcoming holidays: {str(e)}")
+                log_error(f"Error getting dashboard counts: {str(e)}")
             
             return {
                 "total_users": total_users,
@@ -630,7 +631,7 @@ async def get_all_users(
             .order_by(User.created_at.desc())
         )
         users = result.scalars().all()
-        return users
+        return json_list_response(USER_RESPONSE_LIST, UserResponse, users)
         
     except Exception as e:
         log_error(f"Get all users error: {str(e)}")
@@ -669,7 +670,7 @@ async def get_all_leaves(
             .order_by(Leave.created_at.desc())
         )
         leaves = result.scalars().all()
-        return leaves
+        return json_list_response(LEAVE_RESPONSE_LIST, LeaveResponse, leaves)
         
     except Exception as e:
         log_error(f"Get all leaves error: {str(e)}")
@@ -838,7 +839,7 @@ async def get_pending_leaves(
             .order_by(Leave.created_at.asc())
         )
         leaves = result.scalars().all()
-        return leaves
+        return json_list_response(LEAVE_RESPONSE_LIST, LeaveResponse, leaves)
         
     except Exception as e:
         log_error(f"Get pending leaves error: {str(e)}")
@@ -862,64 +863,12 @@ async def create_bulk_holidays(
                 # Convert date string to datetime if needed
                 date_value = holiday_data["date"]
                 if isinstance(date_value, str):
-                    from datetime import datetime
-                    
-                    # Try parsing with different formats
-                    date_formats = [
-                        '%Y-%m-%d',      # YYYY-MM-DD
-                        '%m/%d/%Y',      # MM/DD/YYYY
-                        '%d/%m/%Y',      # DD/MM/YYYY
-                        '%m-%d-%Y',      # MM-DD-YYYY
-                        '%d-%m-%Y',      # DD-MM-YYYY
-                        '%Y/%m/%d',      # YYYY/MM/DD
-                        '%d.%m.%Y',      # DD.MM.YYYY
-                        '%m.%d.%Y',      # MM.DD.YYYY
-                        '%Y.%m.%d',      # YYYY.MM.DD
-                    ]
-                    
-                    parsed_date = None
-                    for fmt in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_value.strip(), fmt)
-                            break
-                        except ValueError:
-                            continue
-                    
-                    if not parsed_date:
-                        # Try parsing with different separators and order combinations
-                        separators = ['-', '/', '.', ' ']
-                        for sep in separators:
-                            if sep in date_value:
-                                parts = date_value.split(sep)
-                                if len(parts) == 3:
-                                    # Try different order combinations
-                                    combinations = [
-                                        (parts[0], parts[1], parts[2]),  # Original order
-                                        (parts[2], parts[0], parts[1]),  # YYYY-MM-DD
-                                        (parts[2], parts[1], parts[0]),  # YYYY-DD-MM
-                                    ]
-                                    
-                                    for year, month, day in combinations:
-                                        try:
-                                            # Ensure proper padding
-                                            year = year.zfill(4)
-                                            month = month.zfill(2)
-                                            day = day.zfill(2)
-                                            
-                                            # Validate year range
-                                            if 1900 <= int(year) <= 2100:
-                                                parsed_date = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                                                break
-                                        except ValueError:
-                                            continue
-                                    if parsed_date:
-                                        break
-                    
-                    if not parsed_date:
+                    # YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, DD.MM.YYYY and similar
+                    try:
+                        holiday_data["date"] = parse_datetime(date_value)
+                    except ValueError:
                         log_error(f"Invalid date format: {date_value}")
                         continue
-                    
-                    holiday_data["date"] = parsed_date
                 
                 # Check if holiday already exists
                 existing_holiday = await db.execute(
@@ -1575,10 +1524,7 @@ async def admin_update_employee_details(
                 )
         
         # Update fields with validation on User
-        update_data = employee_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            if hasattr(user_obj, field) and value is not None:
-                setattr(user_obj, field, value)
+        apply_employee_details_patch(user_obj, employee_data, skip_none=True)
 
         await db.commit()
         await db.refresh(user_obj)
@@ -1642,10 +1588,7 @@ async def admin_patch_employee_details(
                 )
         
         # Update only provided fields (PATCH behavior)
-        update_data = employee_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            if hasattr(user_obj, field) and value is not None:
-                setattr(user_obj, field, value)
+        apply_employee_details_patch(user_obj, employee_data, skip_none=True)
 
         await db.commit()
         await db.refresh(user_obj)
@@ -1759,7 +1702,7 @@ async def admin_create_employment_history(
             detail="Failed to create employment history"
         )
 
-@router.get("/employees", response_model=List[EmployeeSummary])
+@router.get("/employees", response_model=List[EmployeeSummaryListItem])
 async def admin_get_all_employees(
     offset: int = 0,
     limit: int = 10,
@@ -1804,8 +1747,8 @@ async def admin_get_all_employees(
             total_hours = 0
             average_hours_per_day = 0
             
-            employee_summaries.append(EmployeeSummary(
-                user=user,
+            employee_summaries.append(EmployeeSummaryListItem(
+                user=UserResponse.build_from_row(user),
                 employee_details=user,
                 current_position=current_position,
                 recent_tracking=recent_tracking,
@@ -1839,9 +1782,6 @@ async def admin_get_employee_summary(
                 detail="User not found"
             )
         
-        # With merged model, details are the user object
-        employee_details = user
-        
         # Get current position
         current_position_result = await db.execute(
             select(EmploymentHistory)
@@ -1864,9 +1804,10 @@ async def admin_get_employee_summary(
         total_hours = 0
         average_hours_per_day = 0
         
+        user_data = UserResponse.build_from_row(user)
         return EmployeeSummary(
-            user=user,
-            employee_details=employee_details,
+            user=user_data,
+            employee_details=user_data,
             current_position=current_position,
             recent_tracking=recent_tracking,
             total_work_days=total_work_days,
@@ -1921,21 +1862,24 @@ async def get_enhanced_dashboard_stats(
     try:
         today = datetime.now().date()
         
-        # Basic stats
-        total_users = await db.execute(select(func.count(User.id)))
-        total_users = total_users.scalar() or 0
+        # Basic stats in one round-trip
+        counts_result = await db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(Leave.id))
+                .where(Leave.status == LeaveStatus.PENDING)
+                .scalar_subquery()
+            )
+        )
+        total_users, pending_leaves = counts_result.one()
+        total_users = total_users or 0
+        pending_leaves = pending_leaves or 0
         
         # Tracking disabled
         active_users_today = 0
         
-        pending_leaves = await db.execute(
-            select(func.count(Leave.id)).where(Leave.status == LeaveStatus.PENDING)
-        )
-        pending_leaves = pending_leaves.scalar() or 0
-        
-        # Employee-specific stats
-        total_employees_with_details = await db.execute(select(func.count(User.id)))
-        total_employees_with_details = total_employees_with_details.scalar() or 0
+        # Employee-specific stats (every user counts, so this is the same query as total_users)
+        total_employees_with_details = total_users
         
         # Department stats
         department_stats = await db.execute(
@@ -2084,16 +2028,6 @@ def compute_effective_work_seconds(tracker: TimeTracker) -> int:
     )
     return max(0, work_seconds)
 
-def seconds_to_hms(total_seconds: int) -> DurationHMS:
-    """
-    Convert seconds to hours/minutes/seconds breakdown.
-    """
-    safe_seconds = max(0, int(total_seconds or 0))
-    hours = safe_seconds // 3600
-    minutes = (safe_seconds % 3600) // 60
-    seconds = safe_seconds % 60
-    return DurationHMS(hours=hours, minutes=minutes, seconds=seconds)
-
 def tracker_to_dict(tracker: TimeTracker, include_user: bool = False) -> dict:
     """Convert TimeTracker model to dictionary for response."""
     pause_periods = parse_pause_periods(tracker.pause_periods)
@@ -2523,7 +2457,7 @@ async def get_tracker_summary(
                 total_seconds = int(row.total_work_seconds) if row.total_work_seconds else 0
                 total_hours = round(total_seconds / 3600, 2)
                 # Convert to human-readable hours/minutes/seconds format
-                work_hms = seconds_to_hms(total_seconds)
+                work_hms = hms_breakdown(total_seconds)
                 summary_data.append({
                     "user_id": row.user_id,
                     "user_name": user.name,
@@ -2532,11 +2466,7 @@ async def get_tracker_summary(
                     "clock_in": row.clock_in.isoformat() if row.clock_in else None,
                     "clock_out": row.clock_out.isoformat() if row.clock_out else None,
                     "total_work_hours": total_hours,
-                    "total_work_hms": {
-                        "hours": work_hms.hours,
-                        "minutes": work_hms.minutes,
-                        "seconds": work_hms.seconds
-                    },
+                    "total_work_hms": work_hms,
                     "status": str(row.status) if row.status else None
                 })
         
@@ -2599,7 +2529,7 @@ async def get_tracker_summary_grouped(
             # Calculate work time for this tracker
             total_seconds = tracker.total_work_seconds if tracker.total_work_seconds else 0
             total_hours = round(total_seconds / 3600, 2)
-            work_hms = seconds_to_hms(total_seconds)
+            work_hms = hms_breakdown(total_seconds)
             
             # Add tracking record
             user_groups[user_id_key]["tracking_records"].append({
@@ -2607,11 +2537,7 @@ async def get_tracker_summary_grouped(
                 "clock_in": tracker.clock_in.isoformat() if tracker.clock_in else None,
                 "clock_out": tracker.clock_out.isoformat() if tracker.clock_out else None,
                 "total_work_hours": total_hours,
-                "total_work_hms": {
-                    "hours": work_hms.hours,
-                    "minutes": work_hms.minutes,
-                    "seconds": work_hms.seconds
-                },
+                "total_work_hms": work_hms,
                 "status": str(tracker.status) if tracker.status else None
             })
             
@@ -2623,7 +2549,7 @@ async def get_tracker_summary_grouped(
         for user_data in user_groups.values():
             total_seconds = user_data["total_work_seconds"]
             total_hours = round(total_seconds / 3600, 2)
-            total_work_hms = seconds_to_hms(total_seconds)
+            total_work_hms = hms_breakdown(total_seconds)
             # Only count dates with work > 0 (exclude 0-hour / active-only days from avg)
             date_total_seconds = {}
             for r in user_data["tracking_records"]:
@@ -2650,7 +2576,7 @@ async def get_tracker_summary_grouped(
             for dt, recs in sorted(by_date.items(), reverse=True):
                 total_secs = sum(int(round((r.get("total_work_hours") or 0) * 3600)) for r in recs)
                 hrs = round(total_secs / 3600, 2)
-                hms = seconds_to_hms(total_secs)
+                hms = hms_breakdown(total_secs)
                 clock_ins = [r.get("clock_in") for r in recs if r.get("clock_in")]
                 clock_outs = [r.get("clock_out") for r in recs if r.get("clock_out")]
                 status = str(recs[0].get("status") or "TrackerStatus.COMPLETED") if len(recs) == 1 else "Multiple sessions"
@@ -2659,7 +2585,7 @@ async def get_tracker_summary_grouped(
                     "clock_in": min(clock_ins) if clock_ins else None,
                     "clock_out": max(clock_outs) if clock_outs else None,
                     "total_work_hours": hrs,
-                    "total_work_hms": {"hours": hms.hours, "minutes": hms.minutes, "seconds": hms.seconds},
+                    "total_work_hms": hms,
                     "status": status,
                 })
             grouped_data.append({
@@ -2670,11 +2596,7 @@ async def get_tracker_summary_grouped(
                 "tracking_records": aggregated_records,
                 "total_days_tracked": total_days_tracked,
                 "total_work_hours_all_days": total_hours,
-                "total_work_hms_all_days": {
-                    "hours": total_work_hms.hours,
-                    "minutes": total_work_hms.minutes,
-                    "seconds": total_work_hms.seconds
-                }
+                "total_work_hms_all_days": total_work_hms
             })
         
         # Sort by user name
@@ -2727,27 +2649,14 @@ async def get_tracker_hours_summary(
             if tracker.date:
                 daily_totals[tracker.date] = daily_totals.get(tracker.date, 0) + work_seconds
         
-        total_seconds = sum(daily_totals.values())
-        days_worked = len(daily_totals)
-        avg_daily_hours = round((total_seconds / 3600) / days_worked, 2) if days_worked else 0.0
-        avg_daily_seconds = round(total_seconds / days_worked) if days_worked else 0
-        
+        # Hours, averages and HMS breakdowns are computed fields on the models
         summary = TrackerHoursSummary(
-            total_work_seconds=total_seconds,
-            total_work_hours=round(total_seconds / 3600, 2),
-            days_worked=days_worked,
-            avg_daily_hours=avg_daily_hours,
-            total_work_hms=seconds_to_hms(total_seconds),
-            avg_daily_hms=seconds_to_hms(avg_daily_seconds)
+            total_work_seconds=sum(daily_totals.values()),
+            days_worked=len(daily_totals)
         )
         
         daily_models = [
-            TrackerDailyHours(
-                date=day,
-                total_work_seconds=seconds,
-                total_work_hours=round(seconds / 3600, 2),
-                total_work_hms=seconds_to_hms(seconds)
-            )
+            TrackerDailyHours(date=day, total_work_seconds=seconds)
             for day, seconds in sorted(daily_totals.items())
         ]
         
@@ -2813,23 +2722,13 @@ async def get_tracker_hours_by_user(
         
         items = []
         for user_id, entry in per_user.items():
-            days_worked = len(entry["days"])
-            total_seconds = entry["work_seconds"]
-            total_hours = round(total_seconds / 3600, 2)
-            avg_daily_hours = round(total_hours / days_worked, 2) if days_worked else 0.0
-            avg_daily_seconds = round(total_seconds / days_worked) if days_worked else 0
-            
             items.append(
                 TrackerUserHours(
                     user_id=user_id,
                     user_name=entry["user"].name if entry.get("user") else None,
                     user_email=entry["user"].email if entry.get("user") else None,
-                    total_work_seconds=total_seconds,
-                    total_work_hours=total_hours,
-                    days_worked=days_worked,
-                    avg_daily_hours=avg_daily_hours,
-                    total_work_hms=seconds_to_hms(total_seconds),
-                    avg_daily_hms=seconds_to_hms(avg_daily_seconds)
+                    total_work_seconds=entry["work_seconds"],
+                    days_worked=len(entry["days"])
                 )
             )
         
@@ -7,11 +7,11 @@ from typing import List, Optional
 from app.database import get_db
 from app.models import User, EmploymentHistory
 from app.schema import (
-    EmployeeDetailsCreate, EmployeeDetailsUpdate,
+    EmployeeDetailsCreate, EmployeeDetailsUpdate, apply_employee_details_patch,
     EmploymentHistoryCreate, EmploymentHistoryUpdate, EmploymentHistoryResponse,
-    EmployeeSummary, EnhancedTrackerResponse, PaginationParams, UserResponse,
+    EmployeeSummary, EmployeeSummaryListItem, EnhancedTrackerResponse, PaginationParams, UserResponse,
     ProbationReviewCreate, ProbationReviewUpdate, ProbationExtensionCreate,
-    TerminationCreate, TerminationUpdate
+    TerminationCreate, TerminationUpdate, USER_RESPONSE_LIST, json_list_response
 )
 from app.auth import get_current_user, get_current_admin_user
 from app.logger import log_info, log_error
@@ -114,10 +114,7 @@ async def update_employee_details(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         # Update fields
-        update_data = employee_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if hasattr(target, field):
-                setattr(target, field, value)
+        apply_employee_details_patch(target, employee_data)
 
         await db.commit()
         await db.refresh(target)
@@ -148,10 +145,7 @@ async def patch_employee_details(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         # Update only provided fields (PATCH behavior)
-        update_data = employee_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if hasattr(target, field) and value is not None:
-                setattr(target, field, value)
+        apply_employee_details_patch(target, employee_data, skip_none=True)
 
         await db.commit()
         await db.refresh(target)
@@ -386,7 +380,7 @@ async def get_employee_summary(
         average_hours_per_day = 0
         
         return EmployeeSummary(
-            user=user,
+            user=UserResponse.build_from_row(user),
             employee_details=employee_details,
             current_position=current_position,
             recent_tracking=recent_tracking,
@@ -403,7 +397,7 @@ async def get_employee_summary(
             detail="Failed to fetch employee summary"
         )
 
-@router.get("/list", response_model=List[EmployeeSummary])
+@router.get("/list", response_model=List[EmployeeSummaryListItem])
 async def get_all_employees_summary(
     offset: int = 0,
     limit: int = 10,
@@ -443,8 +437,8 @@ async def get_all_employees_summary(
             total_work_days = 0
             average_hours_per_day = 0
             
-            employee_summaries.append(EmployeeSummary(
-                user=user,
+            employee_summaries.append(EmployeeSummaryListItem(
+                user=UserResponse.build_from_row(user),
                 employee_details=user,
                 current_position=current_position,
                 recent_tracking=recent_tracking,
@@ -462,7 +456,7 @@ async def get_all_employees_summary(
         )
 
 # Department-wise employee listing
-@router.get("/department/{department}", response_model=List[EmployeeSummary])
+@router.get("/department/{department}", response_model=List[EmployeeSummaryListItem])
 async def get_employees_by_department(
     department: str,
     current_user: User = Depends(get_current_admin_user),
@@ -494,8 +488,8 @@ async def get_employees_by_department(
             )
             current_position = current_position_result.scalar_one_or_none()
             
-            employee_summaries.append(EmployeeSummary(
-                user=user,
+            employee_summaries.append(EmployeeSummaryListItem(
+                user=UserResponse.build_from_row(user),
                 employee_details=user,
                 current_position=current_position,
                 recent_tracking=[],
@@ -651,7 +645,7 @@ async def get_pending_probation_reviews(
             )
         )
         users = result.scalars().all()
-        return users
+        return json_list_response(USER_RESPONSE_LIST, UserResponse, users)
         
     except Exception as e:
         log_error(f"Get pending probation reviews error: {str(e)}")
@@ -785,7 +779,7 @@ async def get_terminated_employees(
             .order_by(User.termination_date.desc())
         )
         users = result.scalars().all()
-        return users
+        return json_list_response(USER_RESPONSE_LIST, UserResponse, users)
         
     except Exception as e:
         log_error(f"Get terminated employees error: {str(e)}")
@@ -13,7 +13,7 @@ from app.schema import (
 from app.auth import get_current_user, get_current_admin_user
 from app.logger import log_info, log_error
 from app.response import APIResponse
-from app.storage import storage
+from app.storage import StorageInterface, get_storage
 import os
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -21,6 +21,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 def user_to_dict(user: User) -> dict:
     """Convert User model to dictionary for response."""
     # Get file URLs using storage service
+    storage = get_storage()
     profile_image_url = storage.get_file_url(user.profile_image) if user.profile_image else None
     aadhaar_front_url = storage.get_file_url(user.aadhaar_front) if user.aadhaar_front else None
     aadhaar_back_url = storage.get_file_url(user.aadhaar_back) if user.aadhaar_back else None
@@ -151,6 +152,7 @@ async def get_user(
 @router.post("/upload-profile-image")
 async def upload_profile_image(
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -198,6 +200,7 @@ async def upload_profile_image(
 @router.post("/upload-aadhaar-front")
 async def upload_aadhaar_front(
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -245,6 +248,7 @@ async def upload_aadhaar_front(
 @router.post("/upload-aadhaar-back")
 async def upload_aadhaar_back(
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -292,6 +296,7 @@ async def upload_aadhaar_back(
 @router.post("/upload-pan")
 async def upload_pan(
     file: UploadFile = File(...),
+    storage: StorageInterface = Depends(get_storage),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -1,9 +1,55 @@
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional, List, Union
+from pydantic import AfterValidator, AwareDatetime, BaseModel, BeforeValidator, ConfigDict, EmailStr, TypeAdapter, ValidationInfo, computed_field, create_model, field_validator
+from typing import Annotated, Dict, Literal, Optional, List, Union
 from datetime import datetime, date, timezone
 from decimal import Decimal
+from dataclasses import dataclass
 import enum
+import json
+import re
+import sys
 from app.models import UserRole, LeaveStatus, DocumentStatus, TaskStatus
+from app._date_fast import parse_date, parse_datetime, validate_flexible_datetime
+from fastapi import Response
+
+_UTC = timezone.utc
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Cheap syntactic email check for data we issued or already stored.
+# EmailStr (email-validator) stays on signup/creation inputs only.
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+def _check_email(v: str) -> str:
+    if not _EMAIL_RE.match(v):
+        raise ValueError('invalid email')
+    return v
+
+EmailField = Annotated[str, AfterValidator(_check_email)]
+
+# Incoming dates: strings go through the shared fast parser before
+# pydantic-core's datetime check, so no str/datetime union is needed.
+def _coerce_datetime(v, info: ValidationInfo):
+    return validate_flexible_datetime(v, info.field_name)
+
+def _coerce_utc_datetime(v, info: ValidationInfo):
+    return validate_flexible_datetime(v, info.field_name, assume_utc=True)
+
+DateTimeIn = Annotated[datetime, BeforeValidator(_coerce_datetime)]
+UtcDateTimeIn = Annotated[datetime, BeforeValidator(_coerce_utc_datetime)]
+
+def _all_optional(name: str, base: type, **extra_fields) -> type:
+    """Build a PATCH-style model from base: every field Optional and defaulting to None."""
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in base.model_fields.items()
+    }
+    fields.update(extra_fields)
+    return create_model(name, **fields)
 
 # User Schemas
 class UserBase(BaseModel):
@@ -29,53 +75,20 @@ class UserUpdate(BaseModel):
     aadhaar_back: Optional[str] = None
     pan_image: Optional[str] = None
     # When user updates a file, status will be set to pending in backend
-    @field_validator('joining_date')
+    @field_validator('joining_date', mode='before')
     @classmethod
     def validate_joining_date(cls, v):
-        if v is None:
-            return v
         if isinstance(v, str):
-            # Try common date formats
-            date_str = v.strip()
-            for fmt in (
-                '%Y-%m-%d',    # 2025-10-31
-                '%d/%m/%Y',    # 31/10/2025
-                '%m/%d/%Y',    # 10/31/2025
-                '%d-%m-%Y',    # 31-10-2025
-                '%m-%d-%Y',    # 10-31-2025
-                '%Y/%m/%d',    # 2025/10/31
-                '%d.%m.%Y',    # 31.10.2025
-                '%m.%d.%Y',    # 10.31.2025
-                '%Y.%m.%d',    # 2025.10.31
-            ):
-                try:
-                    return datetime.strptime(date_str, fmt).date()
-                except ValueError:
-                    continue
-            # ISO strings like 2025-10-31T00:00:00
             try:
-                return datetime.fromisoformat(date_str).date()
+                return parse_date(v, day_first=True)
             except ValueError:
-                pass
-            raise ValueError(
-                'Invalid joining_date format. Use YYYY-MM-DD or common local formats.'
-            )
+                raise ValueError(
+                    'Invalid joining_date format. Use YYYY-MM-DD or common local formats.'
+                )
         return v
 
-class AdminUserUpdate(BaseModel):
-    name: Optional[str] = None
-    email: Optional[EmailStr] = None
-    phone: Optional[str] = None
-    designation: Optional[str] = None
-    joining_date: Optional[date] = None
-    wifi_user_id: Optional[str] = None
-    role: Optional[UserRole] = None
-    profile_image: Optional[str] = None
-    aadhaar_front: Optional[str] = None
-    aadhaar_back: Optional[str] = None
-    pan_image: Optional[str] = None
-    
-    # Employee details
+class _EmployeeDetailsMixin(BaseModel):
+    """Employee profile fields shared by AdminUserUpdate and UserResponse."""
     employee_id: Optional[str] = None
     date_of_birth: Optional[date] = None
     gender: Optional[str] = None
@@ -107,8 +120,9 @@ class AdminUserUpdate(BaseModel):
     certifications: Optional[str] = None
     education_qualification: Optional[str] = None
     previous_experience_years: Optional[int] = None
-    
-    # Probation details
+
+class _ProbationMixin(BaseModel):
+    """Probation fields shared by AdminUserUpdate and UserResponse."""
     probation_period_months: Optional[int] = None
     probation_start_date: Optional[date] = None
     probation_end_date: Optional[date] = None
@@ -116,8 +130,9 @@ class AdminUserUpdate(BaseModel):
     probation_review_date: Optional[date] = None
     probation_review_notes: Optional[str] = None
     probation_reviewer_id: Optional[int] = None
-    
-    # Termination details
+
+class _TerminationMixin(BaseModel):
+    """Termination fields shared by AdminUserUpdate and UserResponse."""
     termination_date: Optional[date] = None
     termination_reason: Optional[str] = None
     termination_type: Optional[str] = None
@@ -130,43 +145,40 @@ class AdminUserUpdate(BaseModel):
     clearance_status: Optional[str] = None
     final_settlement_amount: Optional[str] = None
     final_settlement_date: Optional[date] = None
-    
-    # Assets & Security
+
+class _AssetsMixin(BaseModel):
+    """Asset and security fields shared by AdminUserUpdate and UserResponse."""
     hardware_allocation: Optional[str] = None
     system_password: Optional[str] = None
+
+# Mixins are listed last-group-first: Pydantic collects fields along the reversed
+# MRO, so this keeps employee -> probation -> termination -> assets field order.
+class AdminUserUpdate(_AssetsMixin, _TerminationMixin, _ProbationMixin, _EmployeeDetailsMixin):
+    name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    designation: Optional[str] = None
+    joining_date: Optional[date] = None
+    wifi_user_id: Optional[str] = None
+    role: Optional[UserRole] = None
+    profile_image: Optional[str] = None
+    aadhaar_front: Optional[str] = None
+    aadhaar_back: Optional[str] = None
+    pan_image: Optional[str] = None
+    
+    model_config = ConfigDict(defer_build=True)
     
     # When admin updates a file, status will be set to pending in backend
-    @field_validator('joining_date')
+    @field_validator('joining_date', mode='before')
     @classmethod
     def validate_joining_date(cls, v):
-        if v is None:
-            return v
         if isinstance(v, str):
-            # Try common date formats
-            date_str = v.strip()
-            for fmt in (
-                '%Y-%m-%d',    # 2025-10-31
-                '%d/%m/%Y',    # 31/10/2025
-                '%m/%d/%Y',    # 10/31/2025
-                '%d-%m-%Y',    # 31-10-2025
-                '%m-%d-%Y',    # 10-31-2025
-                '%Y/%m/%d',    # 2025/10/31
-                '%d.%m.%Y',    # 31.10.2025
-                '%m.%d.%Y',    # 10.31.2025
-                '%Y.%m.%d',    # 2025.10.31
-            ):
-                try:
-                    return datetime.strptime(date_str, fmt).date()
-                except ValueError:
-                    continue
-            # ISO strings like 2025-10-31T00:00:00
             try:
-                return datetime.fromisoformat(date_str).date()
+                return parse_date(v, day_first=True)
             except ValueError:
-                pass
-            raise ValueError(
-                'Invalid joining_date format. Use YYYY-MM-DD or common local formats.'
-            )
+                raise ValueError(
+                    'Invalid joining_date format. Use YYYY-MM-DD or common local formats.'
+                )
         return v
 
 class PasswordChange(BaseModel):
@@ -192,7 +204,8 @@ class AdminPasswordReset(BaseModel):
             raise ValueError('Password must be at least 8 characters long')
         return v
 
-class UserResponse(UserBase):
+class UserResponse(_AssetsMixin, _TerminationMixin, _ProbationMixin, _EmployeeDetailsMixin, UserBase):
+    email: EmailField
     id: int
     role: UserRole
     is_active: bool
@@ -206,70 +219,31 @@ class UserResponse(UserBase):
     aadhaar_front_status: Optional[DocumentStatus] = None
     aadhaar_back_status: Optional[DocumentStatus] = None
     pan_image_status: Optional[DocumentStatus] = None
-    # Employee details
-    employee_id: Optional[str] = None
-    date_of_birth: Optional[date] = None
-    gender: Optional[str] = None
-    marital_status: Optional[str] = None
-    nationality: Optional[str] = None
-    personal_email: Optional[str] = None
-    company_email: Optional[str] = None
-    company_email_password: Optional[str] = None
-    emergency_contact_name: Optional[str] = None
-    emergency_contact_phone: Optional[str] = None
-    emergency_contact_relation: Optional[str] = None
-    current_address: Optional[str] = None
-    permanent_address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    postal_code: Optional[str] = None
-    country: Optional[str] = None
-    department: Optional[str] = None
-    manager_id: Optional[int] = None
-    employment_type: Optional[str] = None
-    work_location: Optional[str] = None
-    work_schedule: Optional[str] = None
-    basic_salary: Optional[str] = None
-    currency: Optional[str] = None
-    bank_name: Optional[str] = None
-    bank_account_number: Optional[str] = None
-    ifsc_code: Optional[str] = None
-    skills: Optional[str] = None
-    certifications: Optional[str] = None
-    education_qualification: Optional[str] = None
-    previous_experience_years: Optional[int] = None
-    
-    # Probation details
-    probation_period_months: Optional[int] = None
-    probation_start_date: Optional[date] = None
-    probation_end_date: Optional[date] = None
-    probation_status: Optional[str] = None
-    probation_review_date: Optional[date] = None
-    probation_review_notes: Optional[str] = None
-    probation_reviewer_id: Optional[int] = None
-    
-    # Termination details
-    termination_date: Optional[date] = None
-    termination_reason: Optional[str] = None
-    termination_type: Optional[str] = None
-    termination_notice_period_days: Optional[int] = None
-    last_working_date: Optional[date] = None
-    termination_notes: Optional[str] = None
-    termination_initiated_by: Optional[int] = None
-    exit_interview_date: Optional[date] = None
-    exit_interview_notes: Optional[str] = None
-    clearance_status: Optional[str] = None
-    final_settlement_amount: Optional[str] = None
-    final_settlement_date: Optional[date] = None
-    
-    # Assets & Security
-    hardware_allocation: Optional[str] = None
-    system_password: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', defer_build=True)
+    
+    @classmethod
+    def build_from_row(cls, row):
+        """Build from a trusted ORM row without re-running field validation."""
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
+# Serialises lists of trusted UserResponse instances straight to JSON bytes
+USER_RESPONSE_LIST = TypeAdapter(List[UserResponse])
+
+
+def json_list_response(adapter: TypeAdapter, model, rows) -> Response:
+    """
+    Build a JSON list response from ORM rows.
+
+    Rows come from our own database: skip response_model re-validation
+    (model.build_from_row) and let pydantic-core write the JSON directly.
+    """
+    return Response(
+        content=adapter.dump_json([model.build_from_row(row) for row in rows]),
+        media_type="application/json",
+    )
 
 # Auth Schemas
 class Token(BaseModel):
@@ -277,11 +251,26 @@ class Token(BaseModel):
     token_type: str
 
 class TokenData(BaseModel):
-    email: Optional[str] = None
+    email: Optional[str] = None  # Token subject we signed ourselves; not re-validated
+    
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v):
+        # Intern: every token for the same user then carries one shared string.
+        # The value is looked up as stored (User.email ==), so its case is kept.
+        return sys.intern(v) if v else v
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: str
     password: str
+    
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        # Credentials are checked against the database, so only bound the input here
+        if len(v) > 254 or '@' not in v:
+            raise ValueError('Invalid email address')
+        return v
 
 # Admin Creation with Secret Code Schema
 class AdminCreateWithSecret(UserBase):
@@ -291,179 +280,31 @@ class AdminCreateWithSecret(UserBase):
 
 # Leave Schemas
 class LeaveBase(BaseModel):
-    start_date: Union[str, datetime]  # Accept both string and datetime
-    end_date: Union[str, datetime]    # Accept both string and datetime
+    start_date: UtcDateTimeIn
+    end_date: UtcDateTimeIn
     total_days: Union[int, float, Decimal]  # Supports decimal values like 4.5 for half-days
     reason: str
 
+def _validate_half_days(v) -> float:
+    """Shared total_days check: positive and in 0.5 increments (half-days)."""
+    # Pydantic has already coerced the value to int, float or Decimal
+    days = float(v)
+    if days <= 0:
+        raise ValueError("Total days must be greater than 0")
+    if not (days + days).is_integer():
+        raise ValueError("Total days must be in 0.5 increments (e.g., 1.0, 1.5, 2.0, 2.5)")
+    return days
+
 class LeaveCreate(LeaveBase):
     @field_validator('total_days')
     @classmethod
     def validate_total_days(cls, v):
         """Validate total_days to support half-days (0.5 increments)"""
-        if isinstance(v, (int, float, Decimal)):
-            # Convert to float for validation
-            days = float(v)
-            
-            # Check if it's a positive number
-            if days <= 0:
-                raise ValueError("Total days must be greater than 0")
-            
-            # Check if it's a valid half-day increment (0.5, 1.0, 1.5, 2.0, etc.)
-            if days * 2 != int(days * 2):
-                raise ValueError("Total days must be in 0.5 increments (e.g., 1.0, 1.5, 2.0, 2.5)")
-            
-            return days
-        else:
-            raise ValueError("Total days must be a number")
-    
-    @field_validator('start_date')
-    @classmethod
-    def validate_start_date(cls, v):
-        if isinstance(v, str):
-            try:
-                # Try parsing as date string (YYYY-MM-DD)
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    # Try with time component
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    # Try parsing with different formats
-                    import re
-                    
-                    # Remove extra spaces and normalize
-                    date_str = v.strip()
-                    
-                    # Handle different date formats
-                    date_formats = [
-                        '%Y-%m-%d',      # YYYY-MM-DD
-                        '%m/%d/%Y',      # MM/DD/YYYY
-                        '%d/%m/%Y',      # DD/MM/YYYY
-                        '%m-%d-%Y',      # MM-DD-YYYY
-                        '%d-%m-%Y',      # DD-MM-YYYY
-                        '%Y/%m/%d',      # YYYY/MM/DD
-                        '%d.%m.%Y',      # DD.MM.YYYY
-                        '%m.%d.%Y',      # MM.DD.YYYY
-                        '%Y.%m.%d',      # YYYY.MM.DD
-                    ]
-                    
-                    for fmt in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_str, fmt)
-                            return parsed_date
-                        except ValueError:
-                            continue
-                    
-                    # Try parsing with different separators and order combinations
-                    separators = ['-', '/', '.', ' ']
-                    for sep in separators:
-                        if sep in date_str:
-                            parts = date_str.split(sep)
-                            if len(parts) == 3:
-                                # Try different order combinations
-                                combinations = [
-                                    (parts[0], parts[1], parts[2]),  # Original order
-                                    (parts[2], parts[0], parts[1]),  # YYYY-MM-DD
-                                    (parts[2], parts[1], parts[0]),  # YYYY-DD-MM
-                                ]
-                                
-                                for year, month, day in combinations:
-                                    try:
-                                        # Ensure proper padding
-                                        year = year.zfill(4)
-                                        month = month.zfill(2)
-                                        day = day.zfill(2)
-                                        
-                                        # Validate year range
-                                        if 1900 <= int(year) <= 2100:
-                                            parsed_date = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                                            return parsed_date
-                                    except ValueError:
-                                        continue
-                    
-                    raise ValueError(f"Invalid start_date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
-        
-        # Ensure the datetime is timezone-aware
-        if isinstance(v, datetime) and v.tzinfo is None:
-            v = v.replace(tzinfo=timezone.utc)
-        return v
-
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v):
-        if isinstance(v, str):
-            try:
-                # Try parsing as date string (YYYY-MM-DD)
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    # Try with time component
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    # Try parsing with different formats
-                    import re
-                    
-                    # Remove extra spaces and normalize
-                    date_str = v.strip()
-                    
-                    # Handle different date formats
-                    date_formats = [
-                        '%Y-%m-%d',      # YYYY-MM-DD
-                        '%m/%d/%Y',      # MM/DD/YYYY
-                        '%d/%m/%Y',      # DD/MM/YYYY
-                        '%m-%d-%Y',      # MM-DD-YYYY
-                        '%d-%m-%Y',      # DD-MM-YYYY
-                        '%Y/%m/%d',      # YYYY/MM/DD
-                        '%d.%m.%Y',      # DD.MM.YYYY
-                        '%m.%d.%Y',      # MM.DD.YYYY
-                        '%Y.%m.%d',      # YYYY.MM.DD
-                    ]
-                    
-                    for fmt in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_str, fmt)
-                            return parsed_date
-                        except ValueError:
-                            continue
-                    
-                    # Try parsing with different separators and order combinations
-                    separators = ['-', '/', '.', ' ']
-                    for sep in separators:
-                        if sep in date_str:
-                            parts = date_str.split(sep)
-                            if len(parts) == 3:
-                                # Try different order combinations
-                                combinations = [
-                                    (parts[0], parts[1], parts[2]),  # Original order
-                                    (parts[2], parts[0], parts[1]),  # YYYY-MM-DD
-                                    (parts[2], parts[1], parts[0]),  # YYYY-DD-MM
-                                ]
-                                
-                                for year, month, day in combinations:
-                                    try:
-                                        # Ensure proper padding
-                                        year = year.zfill(4)
-                                        month = month.zfill(2)
-                                        day = day.zfill(2)
-                                        
-                                        # Validate year range
-                                        if 1900 <= int(year) <= 2100:
-                                            parsed_date = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                                            return parsed_date
-                                    except ValueError:
-                                        continue
-                    
-                    raise ValueError(f"Invalid end_date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
-        
-        # Ensure the datetime is timezone-aware
-        if isinstance(v, datetime) and v.tzinfo is None:
-            v = v.replace(tzinfo=timezone.utc)
-        return v
+        return _validate_half_days(v)
 
 class LeaveUpdate(BaseModel):
-    start_date: Optional[Union[str, datetime]] = None
-    end_date: Optional[Union[str, datetime]] = None
+    start_date: Optional[UtcDateTimeIn] = None
+    end_date: Optional[UtcDateTimeIn] = None
     total_days: Optional[Union[int, float, Decimal]] = None
     reason: Optional[str] = None
     status: Optional[LeaveStatus] = None  # For admin status updates
@@ -472,123 +313,9 @@ class LeaveUpdate(BaseModel):
     @classmethod
     def validate_total_days(cls, v):
         """Validate total_days to support half-days (0.5 increments)"""
-        if v is not None:
-            if isinstance(v, (int, float, Decimal)):
-                # Convert to float for validation
-                days = float(v)
-                
-                # Check if it's a positive number
-                if days <= 0:
-                    raise ValueError("Total days must be greater than 0")
-                
-                # Check if it's a valid half-day increment (0.5, 1.0, 1.5, 2.0, etc.)
-                if days * 2 != int(days * 2):
-                    raise ValueError("Total days must be in 0.5 increments (e.g., 1.0, 1.5, 2.0, 2.5)")
-                
-                return days
-            else:
-                raise ValueError("Total days must be a number")
-        return v
-    
-    @field_validator('start_date')
-    @classmethod
-    def validate_start_date(cls, v):
-        if v is not None:
-            if isinstance(v, str):
-                try:
-                    # Try parsing as ISO format datetime string
-                    parsed = datetime.fromisoformat(v.replace('Z', '+00:00'))
-                    # Ensure timezone-aware
-                    if parsed.tzinfo is None:
-                        parsed = parsed.replace(tzinfo=timezone.utc)
-                    return parsed
-                except ValueError:
-                    try:
-                        # Try with time component
-                        parsed = datetime.fromisoformat(v + 'T00:00:00')
-                        if parsed.tzinfo is None:
-                            parsed = parsed.replace(tzinfo=timezone.utc)
-                        return parsed
-                    except ValueError:
-                        # Try parsing with different formats
-                        date_str = v.strip()
-                        date_formats = [
-                            '%Y-%m-%d',      # YYYY-MM-DD
-                            '%m/%d/%Y',      # MM/DD/YYYY
-                            '%d/%m/%Y',      # DD/MM/YYYY
-                            '%m-%d-%Y',      # MM-DD-YYYY
-                            '%d-%m-%Y',      # DD-MM-YYYY
-                            '%Y/%m/%d',      # YYYY/MM/DD
-                            '%d.%m.%Y',      # DD.MM.YYYY
-                            '%m.%d.%Y',      # MM.DD.YYYY
-                            '%Y.%m.%d',      # YYYY.MM.DD
-                        ]
-                        
-                        for fmt in date_formats:
-                            try:
-                                parsed = datetime.strptime(date_str, fmt)
-                                parsed = parsed.replace(tzinfo=timezone.utc)
-                                return parsed
-                            except ValueError:
-                                continue
-                        
-                        raise ValueError(f"Invalid start_date format: {v}. Supported formats: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, etc.")
-            elif isinstance(v, datetime):
-                # Ensure timezone-aware
-                if v.tzinfo is None:
-                    v = v.replace(tzinfo=timezone.utc)
-                return v
-        return v
-    
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v):
-        if v is not None:
-            if isinstance(v, str):
-                try:
-                    # Try parsing as ISO format datetime string
-                    parsed = datetime.fromisoformat(v.replace('Z', '+00:00'))
-                    # Ensure timezone-aware
-                    if parsed.tzinfo is None:
-                        parsed = parsed.replace(tzinfo=timezone.utc)
-                    return parsed
-                except ValueError:
-                    try:
-                        # Try with time component
-                        parsed = datetime.fromisoformat(v + 'T23:59:59')
-                        if parsed.tzinfo is None:
-                            parsed = parsed.replace(tzinfo=timezone.utc)
-                        return parsed
-                    except ValueError:
-                        # Try parsing with different formats
-                        date_str = v.strip()
-                        date_formats = [
-                            '%Y-%m-%d',      # YYYY-MM-DD
-                            '%m/%d/%Y',      # MM/DD/YYYY
-                            '%d/%m/%Y',      # DD/MM/YYYY
-                            '%m-%d-%Y',      # MM-DD-YYYY
-                            '%d-%m-%Y',      # DD-MM-YYYY
-                            '%Y/%m/%d',      # YYYY/MM/DD
-                            '%d.%m.%Y',      # DD.MM.YYYY
-                            '%m.%d.%Y',      # MM.DD.YYYY
-                            '%Y.%m.%d',      # YYYY.MM.DD
-                        ]
-                        
-                        for fmt in date_formats:
-                            try:
-                                parsed = datetime.strptime(date_str, fmt)
-                                parsed = parsed.replace(tzinfo=timezone.utc)
-                                return parsed
-                            except ValueError:
-                                continue
-                        
-                        raise ValueError(f"Invalid end_date format: {v}. Supported formats: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, etc.")
-            elif isinstance(v, datetime):
-                # Ensure timezone-aware
-                if v.tzinfo is None:
-                    v = v.replace(tzinfo=timezone.utc)
-                return v
-        return v
+        if v is None:
+            return v
+        return _validate_half_days(v)
 
 class LeaveResponse(BaseModel):
     id: int
@@ -602,8 +329,26 @@ class LeaveResponse(BaseModel):
     updated_at: Optional[datetime] = None
     user: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', defer_build=True)
+    
+    @classmethod
+    def build_from_row(cls, row, user: Optional[UserResponse] = None):
+        """
+        Build from a trusted ORM row without re-running field validation.
+        
+        Without an explicit user, the row's user relationship is used if it is already loaded.
+        """
+        data = {name: getattr(row, name) for name in cls.model_fields if name != 'user'}
+        if user is None:
+            # Read the relationship from __dict__ so an unloaded user never triggers a lazy load
+            user_row = row.__dict__.get('user')
+            if user_row is not None:
+                user = UserResponse.build_from_row(user_row)
+        data['user'] = user
+        return cls.model_construct(**data)
+
+# Serialises lists of trusted LeaveResponse instances straight to JSON bytes
+LEAVE_RESPONSE_LIST = TypeAdapter(List[LeaveResponse])
 
 # Holiday Schemas
 class HolidayBase(BaseModel):
@@ -613,162 +358,23 @@ class HolidayBase(BaseModel):
     is_active: bool = True
 
 class HolidayCreate(BaseModel):
-    date: Union[str, datetime]  # Accept both string and datetime
+    date: DateTimeIn
     title: str
     description: Optional[str] = None
     is_active: Optional[bool] = True
-    
-    @field_validator('date')
-    @classmethod
-    def validate_date(cls, v):
-        if isinstance(v, str):
-            try:
-                # Try parsing as date string (YYYY-MM-DD)
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    # Try with time component
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    # Try parsing with different formats
-                    import re
-                    
-                    # Remove extra spaces and normalize
-                    date_str = v.strip()
-                    
-                    # Handle different date formats
-                    date_formats = [
-                        '%Y-%m-%d',      # YYYY-MM-DD
-                        '%m/%d/%Y',      # MM/DD/YYYY
-                        '%d/%m/%Y',      # DD/MM/YYYY
-                        '%m-%d-%Y',      # MM-DD-YYYY
-                        '%d-%m-%Y',      # DD-MM-YYYY
-                        '%Y/%m/%d',      # YYYY/MM/DD
-                        '%d.%m.%Y',      # DD.MM.YYYY
-                        '%m.%d.%Y',      # MM.DD.YYYY
-                        '%Y.%m.%d',      # YYYY.MM.DD
-                    ]
-                    
-                    for fmt in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_str, fmt)
-                            return parsed_date
-                        except ValueError:
-                            continue
-                    
-                    # Try parsing with different separators and order combinations
-                    separators = ['-', '/', '.', ' ']
-                    for sep in separators:
-                        if sep in date_str:
-                            parts = date_str.split(sep)
-                            if len(parts) == 3:
-                                # Try different order combinations
-                                combinations = [
-                                    (parts[0], parts[1], parts[2]),  # Original order
-                                    (parts[2], parts[0], parts[1]),  # YYYY-MM-DD
-                                    (parts[2], parts[1], parts[0]),  # YYYY-DD-MM
-                                ]
-                                
-                                for year, month, day in combinations:
-                                    try:
-                                        # Ensure proper padding
-                                        year = year.zfill(4)
-                                        month = month.zfill(2)
-                                        day = day.zfill(2)
-                                        
-                                        # Validate year range
-                                        if 1900 <= int(year) <= 2100:
-                                            parsed_date = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                                            return parsed_date
-                                    except ValueError:
-                                        continue
-                    
-                    raise ValueError(f"Invalid date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
-        return v
 
 class HolidayUpdate(BaseModel):
-    date: Optional[Union[str, datetime]] = None  # Accept both string and datetime
+    date: Optional[DateTimeIn] = None
     title: Optional[str] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
-    
-    @field_validator('date')
-    @classmethod
-    def validate_date(cls, v):
-        if v is None:
-            return v
-        if isinstance(v, str):
-            try:
-                # Try parsing as date string (YYYY-MM-DD)
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    # Try with time component
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    # Try parsing with different formats
-                    import re
-                    
-                    # Remove extra spaces and normalize
-                    date_str = v.strip()
-                    
-                    # Handle different date formats
-                    date_formats = [
-                        '%Y-%m-%d',      # YYYY-MM-DD
-                        '%m/%d/%Y',      # MM/DD/YYYY
-                        '%d/%m/%Y',      # DD/MM/YYYY
-                        '%m-%d-%Y',      # MM-DD-YYYY
-                        '%d-%m-%Y',      # DD-MM-YYYY
-                        '%Y/%m/%d',      # YYYY/MM/DD
-                        '%d.%m.%Y',      # DD.MM.YYYY
-                        '%m.%d.%Y',      # MM.DD.YYYY
-                        '%Y.%m.%d',      # YYYY.MM.DD
-                    ]
-                    
-                    for fmt in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_str, fmt)
-                            return parsed_date
-                        except ValueError:
-                            continue
-                    
-                    # Try parsing with different separators and order combinations
-                    separators = ['-', '/', '.', ' ']
-                    for sep in separators:
-                        if sep in date_str:
-                            parts = date_str.split(sep)
-                            if len(parts) == 3:
-                                # Try different order combinations
-                                combinations = [
-                                    (parts[0], parts[1], parts[2]),  # Original order
-                                    (parts[2], parts[0], parts[1]),  # YYYY-MM-DD
-                                    (parts[2], parts[1], parts[0]),  # YYYY-DD-MM
-                                ]
-                                
-                                for year, month, day in combinations:
-                                    try:
-                                        # Ensure proper padding
-                                        year = year.zfill(4)
-                                        month = month.zfill(2)
-                                        day = day.zfill(2)
-                                        
-                                        # Validate year range
-                                        if 1900 <= int(year) <= 2100:
-                                            parsed_date = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                                            return parsed_date
-                                    except ValueError:
-                                        continue
-                    
-                    raise ValueError(f"Invalid date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
-        return v
 
 class HolidayResponse(HolidayBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Tracker Schemas
 class PausePeriod(BaseModel):
@@ -787,6 +393,8 @@ class PausePeriod(BaseModel):
     pause_start: datetime
     pause_end: Optional[datetime] = None
 
+_PAUSE_PERIOD_LIST = TypeAdapter(List[PausePeriod])
+
 class TrackerBase(BaseModel):
     date: Optional[date] = None
     clock_in: Optional[datetime] = None
@@ -810,8 +418,15 @@ class TrackerResponse(BaseModel):
     updated_at: Optional[datetime] = None
     user: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+@dataclass(slots=True)
+class TrackerLite:
+    """Compact per-day tracking row embedded in employee summaries."""
+    date: date
+    status: str
+    total_work_seconds: int = 0
+    total_work_hours: float = 0.0
 
 class TrackerCurrentResponse(BaseModel):
     """Response for current active/paused session"""
@@ -831,39 +446,59 @@ class TrackerSummaryResponse(BaseModel):
     total_work_hours: float
     status: str
 
-class DurationHMS(BaseModel):
-    """Hours/minutes/seconds breakdown."""
-    hours: int
-    minutes: int
-    seconds: int
+def hms_breakdown(total_seconds: int) -> Dict[str, int]:
+    """Hours/minutes/seconds breakdown of a duration, as the plain dict the API returns."""
+    safe_seconds = max(0, int(total_seconds or 0))
+    return {
+        "hours": safe_seconds // 3600,
+        "minutes": (safe_seconds % 3600) // 60,
+        "seconds": safe_seconds % 60,
+    }
+
+class _WorkTotals(BaseModel):
+    """total_work_seconds plus the hour/HMS views derived from it on serialisation."""
+    total_work_seconds: int
+    
+    @computed_field
+    @property
+    def total_work_hours(self) -> float:
+        return round(self.total_work_seconds / 3600, 2)
+    
+    @computed_field
+    @property
+    def total_work_hms(self) -> Dict[str, int]:
+        return hms_breakdown(self.total_work_seconds)
 
-class TrackerDailyHours(BaseModel):
+class _WorkAverages(_WorkTotals):
+    """Adds days_worked and the per-day averages derived from it."""
+    days_worked: int
+    
+    @computed_field
+    @property
+    def avg_daily_hours(self) -> float:
+        if not self.days_worked:
+            return 0.0
+        return round(self.total_work_seconds / 3600 / self.days_worked, 2)
+    
+    @computed_field
+    @property
+    def avg_daily_hms(self) -> Dict[str, int]:
+        if not self.days_worked:
+            return hms_breakdown(0)
+        return hms_breakdown(round(self.total_work_seconds / self.days_worked))
+
+class TrackerDailyHours(_WorkTotals):
     """Per-day aggregation for hours charts."""
     date: date
-    total_work_seconds: int
-    total_work_hours: float
-    total_work_hms: DurationHMS
 
-class TrackerHoursSummary(BaseModel):
+class TrackerHoursSummary(_WorkAverages):
     """Aggregate hours summary within a date range."""
-    total_work_seconds: int
-    total_work_hours: float
-    days_worked: int
-    avg_daily_hours: float
-    total_work_hms: DurationHMS
-    avg_daily_hms: DurationHMS
 
-class TrackerUserHours(BaseModel):
+class TrackerUserHours(_WorkAverages):
     """Aggregate hours per user for admin dashboard tables."""
     user_id: int
     user_name: Optional[str] = None
     user_email: Optional[str] = None
-    total_work_seconds: int
-    total_work_hours: float
-    days_worked: int
-    avg_daily_hours: float
-    total_work_hms: DurationHMS
-    avg_daily_hms: DurationHMS
 
 class TrackerHoursResponse(BaseModel):
     """Hours summary plus per-day breakdown."""
@@ -901,24 +536,14 @@ class EmailSettingsBase(BaseModel):
 class EmailSettingsCreate(EmailSettingsBase):
     pass
 
-class EmailSettingsUpdate(BaseModel):
-    smtp_server: Optional[str] = None
-    smtp_port: Optional[int] = None
-    smtp_username: Optional[str] = None
-    smtp_password: Optional[str] = None
-    smtp_use_tls: Optional[bool] = None
-    smtp_use_ssl: Optional[bool] = None
-    from_email: Optional[str] = None
-    from_name: Optional[str] = None
-    is_active: Optional[bool] = None
+EmailSettingsUpdate = _all_optional('EmailSettingsUpdate', EmailSettingsBase)
 
 class EmailSettingsResponse(EmailSettingsBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Email Template Schemas
 class EmailTemplateBase(BaseModel):
@@ -943,8 +568,7 @@ class EmailTemplateResponse(EmailTemplateBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Email Sending Schemas
 class EmailSendRequest(BaseModel):
@@ -973,8 +597,7 @@ class EmailLogResponse(BaseModel):
     sent_at: Optional[datetime] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Employee Details Schemas
 class EmployeeDetailsBase(BaseModel):
@@ -1036,61 +659,20 @@ class EmployeeDetailsBase(BaseModel):
 class EmployeeDetailsCreate(EmployeeDetailsBase):
     user_id: int
 
-class EmployeeDetailsUpdate(BaseModel):
-    employee_id: Optional[str] = None
-    date_of_birth: Optional[date] = None
-    gender: Optional[str] = None
-    marital_status: Optional[str] = None
-    nationality: Optional[str] = None
-    personal_email: Optional[str] = None
-    company_email: Optional[str] = None
-    company_email_password: Optional[str] = None
-    emergency_contact_name: Optional[str] = None
-    emergency_contact_phone: Optional[str] = None
-    emergency_contact_relation: Optional[str] = None
-    current_address: Optional[str] = None
-    permanent_address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    postal_code: Optional[str] = None
-    country: Optional[str] = None
-    department: Optional[str] = None
-    manager_id: Optional[int] = None
-    employment_type: Optional[str] = None
-    work_location: Optional[str] = None
-    work_schedule: Optional[str] = None
-    basic_salary: Optional[str] = None
-    currency: Optional[str] = None
-    bank_name: Optional[str] = None
-    bank_account_number: Optional[str] = None
-    ifsc_code: Optional[str] = None
-    skills: Optional[str] = None
-    certifications: Optional[str] = None
-    education_qualification: Optional[str] = None
-    previous_experience_years: Optional[int] = None
-    
-    # Probation Management
-    probation_period_months: Optional[int] = None
-    probation_start_date: Optional[date] = None
-    probation_end_date: Optional[date] = None
-    probation_status: Optional[str] = None
-    probation_review_date: Optional[date] = None
-    probation_review_notes: Optional[str] = None
-    probation_reviewer_id: Optional[int] = None
-    
-    # Termination Management
-    termination_date: Optional[date] = None
-    termination_reason: Optional[str] = None
-    termination_type: Optional[str] = None
-    termination_notice_period_days: Optional[int] = None
-    last_working_date: Optional[date] = None
-    termination_notes: Optional[str] = None
-    termination_initiated_by: Optional[int] = None
-    exit_interview_date: Optional[date] = None
-    exit_interview_notes: Optional[str] = None
-    clearance_status: Optional[str] = None
-    final_settlement_amount: Optional[str] = None
-    final_settlement_date: Optional[date] = None
+EmployeeDetailsUpdate = _all_optional('EmployeeDetailsUpdate', EmployeeDetailsBase)
+
+# Interned once at import; PATCH handlers walk this instead of model_dump(exclude_unset=True)
+_EMPLOYEE_DETAILS_UPDATE_FIELDS = tuple(sys.intern(name) for name in EmployeeDetailsUpdate.model_fields)
+
+def apply_employee_details_patch(target, patch: EmployeeDetailsUpdate, skip_none: bool = False) -> None:
+    """Copy the fields explicitly set on an EmployeeDetailsUpdate onto a User row."""
+    fields_set = patch.model_fields_set
+    for name in _EMPLOYEE_DETAILS_UPDATE_FIELDS:
+        if name in fields_set:
+            value = getattr(patch, name)
+            if skip_none and value is None:
+                continue
+            setattr(target, name, value)
 
 class EmployeeDetailsResponse(EmployeeDetailsBase):
     id: int
@@ -1103,18 +685,19 @@ class EmployeeDetailsResponse(EmployeeDetailsBase):
     probation_reviewer: Optional[UserResponse] = None
     termination_initiator: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 # Probation Management Schemas
+ProbationReviewStatus = Literal['passed', 'failed', 'extended']
+
 class ProbationReviewCreate(BaseModel):
-    probation_status: str  # passed, failed, extended
+    probation_status: ProbationReviewStatus
     probation_review_date: date
     probation_review_notes: Optional[str] = None
     probation_reviewer_id: int
 
 class ProbationReviewUpdate(BaseModel):
-    probation_status: Optional[str] = None
+    probation_status: Optional[ProbationReviewStatus] = None
     probation_review_date: Optional[date] = None
     probation_review_notes: Optional[str] = None
     probation_reviewer_id: Optional[int] = None
@@ -1125,10 +708,12 @@ class ProbationExtensionCreate(BaseModel):
     probation_reviewer_id: int
 
 # Termination Management Schemas
+TerminationType = Literal['voluntary', 'involuntary', 'retirement']
+
 class TerminationCreate(BaseModel):
     termination_date: date
     termination_reason: str
-    termination_type: str  # voluntary, involuntary, retirement
+    termination_type: TerminationType
     termination_notice_period_days: Optional[int] = None
     last_working_date: Optional[date] = None
     termination_notes: Optional[str] = None
@@ -1137,7 +722,7 @@ class TerminationCreate(BaseModel):
 class TerminationUpdate(BaseModel):
     termination_date: Optional[date] = None
     termination_reason: Optional[str] = None
-    termination_type: Optional[str] = None
+    termination_type: Optional[TerminationType] = None
     termination_notice_period_days: Optional[int] = None
     last_working_date: Optional[date] = None
     termination_notes: Optional[str] = None
@@ -1167,21 +752,9 @@ class EmploymentHistoryBase(BaseModel):
 class EmploymentHistoryCreate(EmploymentHistoryBase):
     user_id: int
 
-class EmploymentHistoryUpdate(BaseModel):
-    position_title: Optional[str] = None
-    department: Optional[str] = None
-    employment_type: Optional[str] = None
-    work_location: Optional[str] = None
-    start_date: Optional[date] = None
-    end_date: Optional[date] = None
-    salary: Optional[str] = None
-    currency: Optional[str] = None
-    manager_id: Optional[int] = None
-    reporting_manager_name: Optional[str] = None
-    status: Optional[str] = None
-    reason_for_change: Optional[str] = None
-    notes: Optional[str] = None
-    is_current: Optional[bool] = None
+EmploymentHistoryUpdate = _all_optional(
+    'EmploymentHistoryUpdate', EmploymentHistoryBase, is_current=(Optional[bool], None)
+)
 
 class EmploymentHistoryResponse(EmploymentHistoryBase):
     id: int
@@ -1192,20 +765,46 @@ class EmploymentHistoryResponse(EmploymentHistoryBase):
     user: Optional[UserResponse] = None
     manager: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 # Enhanced Tracker Response with Employee Details
 class EnhancedTrackerResponse(TrackerResponse):
     employee_details: Optional[EmployeeDetailsResponse] = None
     current_position: Optional[EmploymentHistoryResponse] = None
 
+# Employee list schemas: scalar columns and FK ids only, no nested users
+class EmployeeDetailsListItem(EmployeeDetailsBase):
+    id: int
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+class EmploymentHistoryListItem(EmploymentHistoryBase):
+    id: int
+    user_id: int
+    is_current: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
 # Employee Summary Schema
 class EmployeeSummary(BaseModel):
     user: UserResponse
     employee_details: Optional[UserResponse] = None
     current_position: Optional[EmploymentHistoryResponse] = None
-    recent_tracking: List[TrackerResponse] = []
+    recent_tracking: List[TrackerLite] = []
+    total_work_days: Optional[int] = None
+    average_hours_per_day: Optional[float] = None
+
+class EmployeeSummaryListItem(BaseModel):
+    """Employee summary row for list endpoints; use EmployeeSummary for the detail view."""
+    user: UserResponse
+    employee_details: Optional[EmployeeDetailsListItem] = None
+    current_position: Optional[EmploymentHistoryListItem] = None
+    recent_tracking: List[TrackerLite] = []
     total_work_days: Optional[int] = None
     average_hours_per_day: Optional[float] = None
 
@@ -1224,74 +823,50 @@ class PaginatedResponse(BaseModel):
 class TaskBase(BaseModel):
     name: str
     description: Optional[str] = None
-    due_date: Optional[Union[str, datetime]] = None
+    due_date: Optional[datetime] = None
     priority: Optional[str] = "medium"  # low, medium, high, urgent
     category: Optional[str] = None
 
+def _parse_due_date(v: str) -> datetime:
+    """
+    Parse a due_date string with the shared date parser.
+
+    ISO 8601 input goes through datetime.fromisoformat; other numeric dates
+    (MM/DD/YYYY, DD/MM/YYYY, DD.MM.YYYY, ...) are matched by one precompiled
+    regex. parse_datetime caches per string, so repeated dates are free.
+    """
+    try:
+        return parse_datetime(v)
+    except ValueError:
+        raise ValueError(f"Invalid due_date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
+
+def _validate_due_date(v):
+    """Shared before-validator body for TaskCreate/TaskUpdate.due_date."""
+    if isinstance(v, str):
+        return _parse_due_date(v)
+    # Ensure the datetime is timezone-aware
+    if isinstance(v, datetime) and v.tzinfo is None:
+        return v.replace(tzinfo=_UTC)
+    return v
+
 class TaskCreate(TaskBase):
-    @field_validator('due_date')
+    @field_validator('due_date', mode='before')
     @classmethod
     def validate_due_date(cls, v):
-        if v is not None and isinstance(v, str):
-            try:
-                # Try parsing as date string (YYYY-MM-DD)
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    # Try with time component
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    try:
-                        # Try parsing with different formats
-                        date_str = v.strip()
-                        date_formats = [
-                            '%Y-%m-%d',      # YYYY-MM-DD
-                            '%m/%d/%Y',      # MM/DD/YYYY
-                            '%d/%m/%Y',      # DD/MM/YYYY
-                            '%m-%d-%Y',      # MM-DD-YYYY
-                            '%d-%m-%Y',      # DD-MM-YYYY
-                            '%Y/%m/%d',      # YYYY/MM/DD
-                            '%d.%m.%Y',      # DD.MM.YYYY
-                            '%m.%d.%Y',      # MM.DD.YYYY
-                            '%Y.%m.%d',      # YYYY.MM.DD
-                        ]
-                        
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(date_str, fmt)
-                                return parsed_date
-                            except ValueError:
-                                continue
-                        
-                        raise ValueError(f"Invalid due_date format: {v}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY, etc.")
-                    except Exception:
-                        raise ValueError(f"Invalid due_date format: {v}")
-        
-        # Ensure the datetime is timezone-aware
-        if isinstance(v, datetime) and v.tzinfo is None:
-            v = v.replace(tzinfo=timezone.utc)
-        return v
+        return _validate_due_date(v)
 
 class TaskUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
-    due_date: Optional[Union[str, datetime]] = None
+    due_date: Optional[datetime] = None
     priority: Optional[str] = None
     category: Optional[str] = None
     
-    @field_validator('due_date')
+    @field_validator('due_date', mode='before')
     @classmethod
     def validate_due_date(cls, v):
-        if v is not None and isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v)
-            except ValueError:
-                try:
-                    return datetime.fromisoformat(v + 'T00:00:00')
-                except ValueError:
-                    raise ValueError("Invalid due date format")
-        return v
+        return _validate_due_date(v)
 
 class TaskResponse(TaskBase):
     id: int
@@ -1303,8 +878,7 @@ class TaskResponse(TaskBase):
     updated_at: Optional[datetime] = None
     user: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 # Task Summary Schema
 class TaskSummary(BaseModel):
@@ -1345,13 +919,28 @@ class TimeCorrectionRequestStatus(str, enum.Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
 
+def _parse_utc_timestamp(v: str) -> Optional[datetime]:
+    """Build the common 'YYYY-MM-DDTHH:MM:SSZ' shape from slices; None means use the general parser."""
+    if len(v) != 20 or v[19] != 'Z' or v[10] != 'T':
+        return None
+    if v[4] != '-' or v[7] != '-' or v[13] != ':' or v[16] != ':':
+        return None
+    digits = v[0:4] + v[5:7] + v[8:10] + v[11:13] + v[14:16] + v[17:19]
+    if not digits.isdigit():
+        return None
+    try:
+        return datetime(int(v[0:4]), int(v[5:7]), int(v[8:10]),
+                        int(v[11:13]), int(v[14:16]), int(v[17:19]), tzinfo=_UTC)
+    except ValueError:
+        return None
+
 class TimeCorrectionRequestCreate(BaseModel):
     request_date: Union[str, date]
     issue_type: str  # missed_clock_in, missed_clock_out, wrong_time, forgot_clock_out, forgot_resume
     tracker_id: Optional[int] = None  # Specific tracker ID to correct (when multiple entries exist for same date)
     
-    requested_clock_in: Optional[Union[str, datetime]] = None
-    requested_clock_out: Optional[Union[str, datetime]] = None
+    requested_clock_in: Optional[AwareDatetime] = None
+    requested_clock_out: Optional[AwareDatetime] = None
     # When provided as a list from the client, this is a list of PausePeriod
     # objects (each with pause_start and pause_end datetimes). The validator
     # below will convert the list into a JSON string that is stored as-is on
@@ -1365,30 +954,32 @@ class TimeCorrectionRequestCreate(BaseModel):
     def validate_request_date(cls, v):
         if isinstance(v, str):
             try:
+                # fromisoformat already covers YYYY-MM-DD, so no strptime fallback is needed
                 return datetime.fromisoformat(v).date()
             except ValueError:
-                # Try common formats
-                try:
-                    return datetime.strptime(v, '%Y-%m-%d').date()
-                except ValueError:
-                    raise ValueError("Invalid request_date format")
+                raise ValueError("Invalid request_date format")
         return v
     
-    @field_validator('requested_clock_in', 'requested_clock_out')
+    @field_validator('requested_clock_in', 'requested_clock_out', mode='before')
     @classmethod
     def validate_times(cls, v):
         if v is None:
             return v
         if isinstance(v, str):
+            parsed = _parse_utc_timestamp(v)
+            if parsed is not None:
+                return parsed
             try:
-                dt = datetime.fromisoformat(v.replace('Z', '+00:00'))
+                # Only a trailing 'Z' needs rewriting; no need to scan the whole string
+                iso = v[:-1] + '+00:00' if v.endswith('Z') else v
+                dt = datetime.fromisoformat(iso)
                 if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
+                    dt = dt.replace(tzinfo=_UTC)
                 return dt
             except ValueError:
                 raise ValueError(f"Invalid datetime format: {v}")
         if isinstance(v, datetime) and v.tzinfo is None:
-            return v.replace(tzinfo=timezone.utc)
+            return v.replace(tzinfo=_UTC)
         return v
 
     @field_validator('requested_pause_periods')
@@ -1397,17 +988,23 @@ class TimeCorrectionRequestCreate(BaseModel):
         if v is None:
             return None
         if isinstance(v, list):
-            import json
-            # Verify list items are PausePeriod or dicts
-            return json.dumps([p.model_dump() if hasattr(p, 'model_dump') else p for p in v], default=str)
+            # Pydantic has already validated every item into a PausePeriod;
+            # pydantic-core serialises the whole list to JSON in one call
+            return _PAUSE_PERIOD_LIST.dump_json(v).decode()
         if isinstance(v, str):
-            # Evaluate if it's valid JSON
-            import json
-            try:
-                json.loads(v)
-                return v
-            except ValueError:
+            # Cheap shape check; the full parse is debug-only because the create
+            # endpoint (time_corrections.create_time_correction_request) runs
+            # json.loads on requested_pause_periods and rejects bad JSON with a 400.
+            # Approval copies the string onto the tracker without parsing it.
+            stripped = v.lstrip()
+            if not stripped or stripped[0] not in '[{':
                 raise ValueError("Invalid JSON string for pause periods")
+            if __debug__:
+                try:
+                    _json_loads(v)
+                except ValueError:
+                    raise ValueError("Invalid JSON string for pause periods")
+            return v
         return v
 
 class TimeCorrectionRequestUpdate(BaseModel):
@@ -1425,8 +1022,7 @@ class TimeCorrectionLogResponse(BaseModel):
     created_at: datetime
     performer: Optional[UserResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class TimeCorrectionRequestResponse(BaseModel):
     id: int
@@ -1457,5 +1053,17 @@ class TimeCorrectionRequestResponse(BaseModel):
     reviewer: Optional[UserResponse] = None
     logs: Optional[List[TimeCorrectionLogResponse]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# Schemas whose pydantic-core validators are built during app startup
+PREWARM_MODELS = (
+    EmployeeDetailsResponse, EmployeeDetailsCreate, EmployeeDetailsUpdate,
+    EmploymentHistoryResponse, TaskResponse, TaskCreate, TaskUpdate,
+    EnhancedTrackerResponse, EmployeeSummary, EmployeeSummaryListItem,
+    UserResponse, AdminUserUpdate, LeaveResponse,
+)
+
+def prewarm_schemas() -> None:
+    """Build core schemas up front so the first request doesn't pay for deferred builds."""
+    for model in PREWARM_MODELS:
+        model.model_rebuild(force=True)
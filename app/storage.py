@@ -4,18 +4,22 @@ Supports both local storage (development) and S3 (production).
 """
 import os
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, BinaryIO
 from abc import ABC, abstractmethod
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from app.logger import log_info, log_error
 
 # Storage configuration
 STORAGE_TYPE = os.getenv("STORAGE_TYPE", "local").lower()  # 'local' or 's3'
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_DIR = Path("uploads")  # Created by LocalStorage when it is instantiated
 
 # S3 Configuration
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "")
@@ -29,8 +33,52 @@ S3_CDN_URL = os.getenv("S3_CDN_URL", None)  # Optional CDN URL for serving files
 LOCAL_BASE_URL = os.getenv("LOCAL_BASE_URL", "http://localhost:8000")  # Base URL for local file serving
 
 # File validation
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".pdf"}
+ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".pdf"})
+_CONTENT_TYPES: dict[str, str] = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".pdf": "application/pdf",
+}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Read/write uploads in 64KB chunks
+S3_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024  # S3 minimum part size
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))  # Shared by all threadpool uploads
+
+
+def _file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="File size too large. Maximum size is 10MB."
+    )
+
+
+def _copy_upload(source: BinaryIO, destination: str) -> None:
+    """
+    Stream an upload to disk in fixed-size chunks, enforcing MAX_FILE_SIZE.
+    
+    Blocking; run it in a threadpool. A partially written file is removed on failure.
+    """
+    written = 0
+    try:
+        # Raw fd writes: each chunk is already large, so a buffered writer only adds copies
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_FILE_SIZE:
+                    raise _file_too_large()
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except BaseException:
+        try:
+            os.unlink(destination)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 class StorageInterface(ABC):
@@ -61,11 +109,27 @@ class StorageInterface(ABC):
         if not file.filename:
             return False
         
-        file_ext = Path(file.filename).suffix.lower()
+        return os.path.splitext(file.filename)[1].lower() in ALLOWED_EXTENSIONS
+    
+    def _validate_and_get_ext(self, file: UploadFile) -> str:
+        """Return the lowercased file extension, raising 400 if the type is not allowed."""
+        file_ext = os.path.splitext(file.filename)[1].lower() if file.filename else ""
         if file_ext not in ALLOWED_EXTENSIONS:
-            return False
-        
-        return True
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid file type. Only JPG, PNG, and PDF files are allowed."
+            )
+        return file_ext
+    
+    def check_declared_size(self, file: UploadFile) -> None:
+        """Reject an upload whose known or declared size exceeds MAX_FILE_SIZE before reading it."""
+        declared = file.size
+        if declared is None:
+            content_length = file.headers.get("content-length") if file.headers else None
+            if content_length and content_length.isdigit():
+                declared = int(content_length)
+        if declared is not None and declared > MAX_FILE_SIZE:
+            raise _file_too_large()
 
 
 class LocalStorage(StorageInterface):
@@ -74,7 +138,9 @@ class LocalStorage(StorageInterface):
     def __init__(self, upload_dir: Path = UPLOAD_DIR, base_url: str = LOCAL_BASE_URL):
         self.upload_dir = upload_dir
         self.base_url = base_url
-        self.upload_dir.mkdir(exist_ok=True)
+        # String form reused for every upload path
+        self._upload_dir_str = str(upload_dir)
+        os.makedirs(self._upload_dir_str, exist_ok=True)
     
     async def upload_file(
         self, 
@@ -83,32 +149,17 @@ class LocalStorage(StorageInterface):
         document_type: str
     ) -> str:
         """Save uploaded file locally and return the relative file path."""
-        if not self.validate_file(file):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file type. Only JPG, PNG, and PDF files are allowed."
-            )
+        file_ext = self._validate_and_get_ext(file)
+        self.check_declared_size(file)
         
         # Generate unique filename
-        file_ext = Path(file.filename).suffix.lower()
-        unique_filename = f"{user_id}_{document_type}_{uuid.uuid4()}{file_ext}"
-        file_path = self.upload_dir / unique_filename
-        
-        # Read file content
-        content = await file.read()
+        unique_filename = f"{user_id}_{document_type}_{uuid.uuid4().hex}{file_ext}"
+        file_path = os.path.join(self._upload_dir_str, unique_filename)
         
-        # Check file size
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File size too large. Maximum size is 10MB."
-            )
+        # Stream to disk off the event loop instead of buffering the whole file
+        await run_in_threadpool(_copy_upload, file.file, file_path)
         
-        # Save file
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-        
-        log_info(f"File saved locally: {file_path}")
+        log_info("File saved locally: %s", file_path)
         # Return relative path for database storage
         return f"uploads/{unique_filename}"
     
@@ -118,11 +169,11 @@ class LocalStorage(StorageInterface):
             return ""
         
         # If it's already a full URL, return as is
-        if file_path.startswith("http://") or file_path.startswith("https://"):
+        if file_path.startswith(("http://", "https://")):
             return file_path
         
         # Remove 'uploads/' prefix if present
-        relative_path = file_path.replace("uploads/", "").replace("uploads\\", "")
+        relative_path = file_path.replace("uploads/", "", 1).replace("uploads\\", "", 1)
         
         # Return URL for local file serving
         return f"{self.base_url}/uploads/{relative_path}"
@@ -134,15 +185,15 @@ class LocalStorage(StorageInterface):
             if file_path.startswith("uploads/"):
                 full_path = Path(file_path)
             else:
-                full_path = self.upload_dir / file_path.replace("uploads/", "").replace("uploads\\", "")
+                full_path = self.upload_dir / file_path.replace("uploads/", "", 1).replace("uploads\\", "", 1)
             
             if full_path.exists():
                 full_path.unlink()
-                log_info(f"File deleted locally: {full_path}")
+                log_info("File deleted locally: %s", full_path)
                 return True
             return False
         except Exception as e:
-            log_error(f"Error deleting local file {file_path}: {str(e)}")
+            log_error("Error deleting local file %s: %s", file_path, e)
             return False
 
 
@@ -166,9 +217,11 @@ class S3Storage(StorageInterface):
         self.cdn_url = cdn_url
         self.endpoint_url = endpoint_url
         
-        # Initialize S3 client
+        # Initialize S3 client; botocore's default pool of 10 connections would
+        # serialise concurrent threadpool uploads (each multipart upload uses up to 10)
         s3_config = {
-            'region_name': region
+            'region_name': region,
+            'config': Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
         }
         
         if access_key_id and secret_access_key:
@@ -179,13 +232,20 @@ class S3Storage(StorageInterface):
             s3_config['endpoint_url'] = endpoint_url
         
         self.s3_client = boto3.client('s3', **s3_config)
+        # Files above one part are sent as concurrent multipart uploads
+        self._transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+            max_concurrency=10,
+            use_threads=True
+        )
         
         # Verify bucket exists
         try:
             self.s3_client.head_bucket(Bucket=bucket_name)
-            log_info(f"S3 storage initialized for bucket: {bucket_name}")
+            log_info("S3 storage initialized for bucket: %s", bucket_name)
         except ClientError as e:
-            log_error(f"Error accessing S3 bucket {bucket_name}: {str(e)}")
+            log_error("Error accessing S3 bucket %s: %s", bucket_name, e)
             raise
     
     async def upload_file(
@@ -195,49 +255,40 @@ class S3Storage(StorageInterface):
         document_type: str
     ) -> str:
         """Upload file to S3 and return the S3 key."""
-        if not self.validate_file(file):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file type. Only JPG, PNG, and PDF files are allowed."
-            )
+        file_ext = self._validate_and_get_ext(file)
+        self.check_declared_size(file)
         
         # Generate unique filename
-        file_ext = Path(file.filename).suffix.lower()
-        unique_filename = f"{user_id}_{document_type}_{uuid.uuid4()}{file_ext}"
+        unique_filename = f"{user_id}_{document_type}_{uuid.uuid4().hex}{file_ext}"
         s3_key = f"documents/{user_id}/{unique_filename}"
         
-        # Read file content
-        content = await file.read()
-        
-        # Check file size
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File size too large. Maximum size is 10MB."
-            )
+        # Check file size without reading the content into memory
+        source = file.file
+        source.seek(0, os.SEEK_END)
+        if source.tell() > MAX_FILE_SIZE:
+            raise _file_too_large()
+        source.seek(0)
         
         # Determine content type
-        content_type = file.content_type or "application/octet-stream"
-        if file_ext in [".jpg", ".jpeg"]:
-            content_type = "image/jpeg"
-        elif file_ext == ".png":
-            content_type = "image/png"
-        elif file_ext == ".pdf":
-            content_type = "application/pdf"
+        content_type = _CONTENT_TYPES.get(file_ext, file.content_type or "application/octet-stream")
         
-        # Upload to S3
+        # Upload to S3 (blocking, so run off the event loop)
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=content,
-                ContentType=content_type,
-                ACL='public-read'  # Make files publicly accessible
+            await run_in_threadpool(
+                self.s3_client.upload_fileobj,
+                source,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': content_type,
+                    'ACL': 'public-read'  # Make files publicly accessible
+                },
+                Config=self._transfer_config
             )
-            log_info(f"File uploaded to S3: {s3_key}")
+            log_info("File uploaded to S3: %s", s3_key)
             return s3_key
-        except ClientError as e:
-            log_error(f"Error uploading to S3: {str(e)}")
+        except (ClientError, S3UploadFailedError) as e:
+            log_error("Error uploading to S3: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to upload file to S3"
@@ -249,7 +300,7 @@ class S3Storage(StorageInterface):
             return ""
         
         # If it's already a full URL, return as is
-        if file_path.startswith("http://") or file_path.startswith("https://"):
+        if file_path.startswith(("http://", "https://")):
             return file_path
         
         # If CDN URL is configured, use it
@@ -267,27 +318,29 @@ class S3Storage(StorageInterface):
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file from S3."""
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=file_path)
-            log_info(f"File deleted from S3: {file_path}")
+            await run_in_threadpool(self.s3_client.delete_object, Bucket=self.bucket_name, Key=file_path)
+            log_info("File deleted from S3: %s", file_path)
             return True
         except ClientError as e:
-            log_error(f"Error deleting S3 file {file_path}: {str(e)}")
+            log_error("Error deleting S3 file %s: %s", file_path, e)
             return False
 
 
+@lru_cache(maxsize=1)
 def get_storage() -> StorageInterface:
-    """Factory function to get the appropriate storage implementation."""
+    """
+    Return the shared storage implementation, creating it on first use.
+    
+    Lazy so that importing this module (and app startup) never blocks on the
+    S3 head_bucket check.
+    """
     if STORAGE_TYPE == "s3":
         try:
             return S3Storage()
         except Exception as e:
-            log_error(f"Failed to initialize S3 storage: {str(e)}")
+            log_error("Failed to initialize S3 storage: %s", e)
             log_info("Falling back to local storage")
             return LocalStorage()
     else:
         return LocalStorage()
 
-
-# Global storage instance
-storage = get_storage()
-
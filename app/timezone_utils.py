@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -6,6 +7,11 @@ from zoneinfo import ZoneInfo
 # Canonical business timezone for the application (India Standard Time).
 IST = ZoneInfo("Asia/Kolkata")
 
+# Per-request slot for get_now_and_today_ist. RequestClockMiddleware installs an
+# empty list for each HTTP request; outside a request it stays None and nothing
+# is cached.
+_request_now: ContextVar[Optional[list]] = ContextVar("_request_now", default=None)
+
 
 def ensure_timezone_aware(
     dt: Optional[datetime] | str,
@@ -24,9 +30,15 @@ def ensure_timezone_aware(
 
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+            # Python 3.11+ accepts a trailing 'Z' directly
+            dt = datetime.fromisoformat(dt)
         except ValueError:
-            return None
+            if not dt.endswith("Z"):
+                return None
+            try:
+                dt = datetime.fromisoformat(dt[:-1] + "+00:00")
+            except ValueError:
+                return None
 
     if dt.tzinfo is None:
         return dt.replace(tzinfo=assume_tz)
@@ -34,15 +46,39 @@ def ensure_timezone_aware(
     return dt
 
 
-def get_now_and_today_ist() -> tuple[datetime, datetime.date]:
+def get_now_and_today_ist(cached: bool = True) -> tuple[datetime, datetime.date]:
     """
     Return the current time and date in IST.
 
     The underlying clock uses UTC and then converts to IST, so behavior is
     consistent regardless of the server's local timezone settings.
+
+    Within an HTTP request the first result is reused, so every caller in
+    that request sees the same instant. Pass cached=False for a fresh reading.
     """
+    slot = _request_now.get() if cached else None
+    if slot:
+        return slot[0]
     now_utc = datetime.now(timezone.utc)
     now_ist = now_utc.astimezone(IST)
     today_ist = now_ist.date()
+    if slot is not None:
+        slot.append((now_ist, today_ist))
     return now_ist, today_ist
 
+
+class RequestClockMiddleware:
+    """ASGI middleware giving each HTTP request its own get_now_and_today_ist cache."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_now.set([])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_now.reset(token)
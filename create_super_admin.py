@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
 from app.models import User, UserRole
 from app.auth import get_password_hash
 from app.database import DATABASE_URL
@@ -21,7 +22,7 @@ async def create_super_admin():
     print("Starting super admin creation process...")
     print(f"Database URL: {DATABASE_URL.split('@')[1] if '@' in DATABASE_URL else 'Local database'}")
     
-    engine = create_async_engine(DATABASE_URL, echo=False)
+    engine = create_async_engine(DATABASE_URL, echo=os.getenv("SQLALCHEMY_ECHO", "0") == "1")
     
     # Create async session factory
     AsyncSessionLocal = sessionmaker(
@@ -59,53 +60,42 @@ async def create_super_admin():
             print(f"   Name: {admin_name}")
             print(f"   Force Reset: {force_reset}")
 
-            # Check if user already exists
-            result = await session.execute(
-                select(User).where(User.email == admin_email)
+            # Only used to report what happened: MySQL's affected-row count is 1 both
+            # for a fresh insert and for an existing row that needed no change
+            existing_id = await session.scalar(select(User.id).where(User.email == admin_email))
+
+            # Create the user, or promote/reactivate an existing one, in a single
+            # atomic statement (UserRole has no SUPER_ADMIN member; ADMIN is the top role)
+            stmt = insert(User).values(
+                email=admin_email,
+                hashed_password=get_password_hash(admin_password),
+                name=admin_name,
+                role=UserRole.ADMIN,
+                is_active=True
             )
-            super_admin_user = result.scalar_one_or_none()
+            update_values = {"role": UserRole.ADMIN, "is_active": True}
+            if force_reset:
+                update_values["hashed_password"] = stmt.inserted.hashed_password
+            if os.getenv("ADMIN_UPDATE_NAME", "false").lower() in {"1", "true", "yes"}:
+                update_values["name"] = stmt.inserted.name
+            result = await session.execute(stmt.on_duplicate_key_update(**update_values))
+            await session.commit()
             
-            if not super_admin_user:
-                # Create super admin user
-                super_admin_user = User(
-                    email=admin_email,
-                    hashed_password=get_password_hash(admin_password),
-                    name=admin_name,
-                    role=UserRole.SUPER_ADMIN,
-                    is_active=True
-                )
-                session.add(super_admin_user)
-                await session.commit()
-                print("SUCCESS: Super admin user created successfully!")
+            if existing_id is None:
+                print("SUCCESS: Super admin user created")
                 print(f"   Email: {admin_email}")
                 print(f"   Password: {admin_password}")
-                print("   Role: super_admin")
             else:
-                # Optionally update existing user to super admin / reset password
-                updated = False
-                if super_admin_user.role != UserRole.SUPER_ADMIN:
-                    super_admin_user.role = UserRole.SUPER_ADMIN
-                    updated = True
-                if not super_admin_user.is_active:
-                    super_admin_user.is_active = True
-                    updated = True
-                if force_reset:
-                    super_admin_user.hashed_password = get_password_hash(admin_password)
-                    updated = True
-                if super_admin_user.name != admin_name and os.getenv("ADMIN_UPDATE_NAME", "false").lower() in {"1", "true", "yes"}:
-                    super_admin_user.name = admin_name
-                    updated = True
-                if updated:
-                    await session.commit()
+                # MySQL reports 2 affected rows when an existing row was changed
+                if result.rowcount == 2:
                     print("SUCCESS: Existing user updated to super admin")
-                    print(f"   Email: {admin_email}")
-                    if force_reset:
-                        print(f"   Password reset to: {admin_password}")
-                    print("   Role: super_admin")
                 else:
-                    print("INFO:  Super admin user already exists and is up-to-date")
-                    print(f"   Email: {super_admin_user.email}")
-                    print(f"   Role: {super_admin_user.role}")
+                    print("SUCCESS: Existing super admin already up-to-date")
+                print(f"   Email: {admin_email}")
+                # The password is only applied to an existing account on a forced reset
+                if force_reset:
+                    print(f"   Password reset to: {admin_password}")
+            print("   Role: admin")
         
         print("\nSuper admin creation process completed successfully!")
         
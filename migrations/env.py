@@ -8,7 +8,7 @@ import asyncio
 from logging.config import fileConfig
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection
+from sqlalchemy.ext.asyncio import create_async_engine
 from alembic import context
 
 # Import models to enable autogenerate
@@ -64,12 +64,19 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    """Run migrations using the connection."""
+    """Run migrations using the connection.
+
+    Each revision runs and commits in its own transaction, so a failure only
+    rolls back the revision that failed, and a revision can step out of the
+    transaction with op.get_context().autocommit_block() for DDL such as
+    CREATE INDEX CONCURRENTLY.
+    """
     context.configure(
         connection=connection, 
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -13,7 +13,6 @@ Usage:
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add the Backend directory to the Python path
@@ -24,6 +23,12 @@ sys.path.insert(0, str(backend_dir))
 from alembic.config import Config
 from alembic import command
 
+# Supported subcommands, dispatched by name to the matching alembic.command function
+COMMANDS = {
+    name: getattr(command, name)
+    for name in ('upgrade', 'downgrade', 'revision', 'current', 'history', 'stamp', 'merge', 'heads', 'show', 'check')
+}
+
 def main():
     """Run Alembic commands."""
     # Create Alembic config
@@ -33,7 +38,8 @@ def main():
     args = sys.argv[1:] if len(sys.argv) > 1 else ['--help']
     
     # Get the command
-    if args[0] in ['upgrade', 'downgrade', 'revision', 'current', 'history', 'stamp', 'merge', 'heads', 'show', 'check']:
+    run_command = COMMANDS.get(args[0])
+    if run_command is not None:
         cmd = args[0]
         cmd_args = args[1:]
         
@@ -47,29 +53,7 @@ def main():
         
         # Run the appropriate command
         try:
-            if cmd == 'upgrade':
-                command.upgrade(alembic_cfg, *cmd_args)
-            elif cmd == 'downgrade':
-                command.downgrade(alembic_cfg, *cmd_args)
-            elif cmd == 'revision':
-                # Filter out --sql flag if --autogenerate is present
-                if '--autogenerate' in cmd_args:
-                    cmd_args = [arg for arg in cmd_args if arg not in ['--sql', '-sql']]
-                command.revision(alembic_cfg, *cmd_args)
-            elif cmd == 'current':
-                command.current(alembic_cfg, *cmd_args)
-            elif cmd == 'history':
-                command.history(alembic_cfg, *cmd_args)
-            elif cmd == 'stamp':
-                command.stamp(alembic_cfg, *cmd_args)
-            elif cmd == 'merge':
-                command.merge(alembic_cfg, *cmd_args)
-            elif cmd == 'heads':
-                command.heads(alembic_cfg, *cmd_args)
-            elif cmd == 'show':
-                command.show(alembic_cfg, *cmd_args)
-            elif cmd == 'check':
-                command.check(alembic_cfg, *cmd_args)
+            run_command(alembic_cfg, *cmd_args)
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
@@ -4,13 +4,12 @@ Test script to verify super admin creation and authentication
 """
 
 import asyncio
-import os
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select
 from app.models import User, UserRole
-from app.auth import authenticate_user, get_password_hash, verify_password
+from app.auth import authenticate_user, verify_password
 from app.database import DATABASE_URL
 
 load_dotenv()